@@ -5,30 +5,150 @@ No mocks, no simulations, no placeholders - production ready
 """
 
 import MetaTrader5 as mt5
+import aiohttp
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 import json
 import time
 import logging
+import logging.handlers
 import sys
+import atexit
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import csv
+import io
 import os
 from pathlib import Path
 
-# Configure logging
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Configure logging: the file/stream handlers run on a QueueListener
+# thread, so a logger call on the trading path is a queue put instead of
+# formatting plus a write syscall under the logging lock
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('trading_system.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler needs a pass-through formatter: without format=,
+# basicConfig would attach BASIC_FORMAT, which QueueHandler.prepare()
+# bakes into the record before the listener-side handlers format again
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('trading_system.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+def _json_loads(payload):
+    """Decode a JSON payload, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_dumps(data) -> str:
+    """Encode data as a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+# Value of one point per lot, by symbol (XAUUSD: 1 lot = 100 oz,
+# 1 point = $0.01/oz, so $1 per point per lot)
+_VALUE_PER_POINT = {'XAUUSD': 1.0}
+
+
+def _position_size(balance: float, entry: float, sl: float,
+                   value_per_point: float, risk_pct: float) -> float:
+    """Raw lot-size arithmetic; JIT-compiled when numba is installed"""
+    risk_amount = balance * risk_pct
+    points_at_risk = abs(entry - sl)
+    if points_at_risk == 0.0:
+        return 0.0
+    return risk_amount / (points_at_risk * value_per_point)
+
+
+if numba is not None:
+    # Fixed FP64 signature compiles to a handful of instructions;
+    # cache=True reuses the compiled artifact across restarts
+    _position_size = numba.njit(
+        'float64(float64,float64,float64,float64,float64)', cache=True
+    )(_position_size)
+
+
+# Open-position record: tuple slots beat an 11-key dict per position when
+# many are open. open_time stays a raw epoch; convert with
+# datetime.fromtimestamp only where it is actually displayed
+Position = namedtuple('Position', [
+    'ticket', 'symbol', 'type', 'volume', 'open_price', 'current_price',
+    'sl', 'tp', 'profit', 'comment', 'open_time'
+])
+
+# Live-quote record: one fixed field set across all three sources, with
+# direct slot access instead of hashed dict lookups on the hot path
+Tick = namedtuple('Tick', ['price', 'bid', 'ask', 'timestamp', 'source'])
+
+# Filled-order record: like Position, a slotted tuple instead of a fresh
+# multi-key dict per executed trade
+OrderResult = namedtuple('OrderResult', [
+    'ticket', 'volume', 'price', 'type', 'symbol', 'sl', 'tp', 'comment',
+    'timestamp'
+])
+
+# Timeframe strings to MT5 constants, built once at import time
+_TIMEFRAME_MAP = {
+    '1m': mt5.TIMEFRAME_M1,
+    '5m': mt5.TIMEFRAME_M5,
+    '15m': mt5.TIMEFRAME_M15,
+    '30m': mt5.TIMEFRAME_M30,
+    '1h': mt5.TIMEFRAME_H1,
+    '4h': mt5.TIMEFRAME_H4,
+    '1d': mt5.TIMEFRAME_D1
+}
+
+# Process-wide MT5 terminal connection state: mt5.initialize() is an IPC
+# round-trip, so pay it once instead of on every fetch
+_mt5_ready = False
+
+
+def _ensure_mt5() -> bool:
+    """Initialize the MT5 terminal connection once per process"""
+    global _mt5_ready
+    if _mt5_ready:
+        return True
+    if not mt5.initialize():
+        return False
+    _mt5_ready = True
+    return True
+
 
 class ConfigManager:
     """Manages configuration from config.json"""
@@ -40,12 +160,13 @@ class ConfigManager:
     def _load_config(self) -> Dict:
         """Load configuration file"""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             logger.error(f"Config file not found: {self.config_path}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             logger.error(f"Invalid JSON in config file: {e}")
             sys.exit(1)
     
@@ -54,83 +175,169 @@ class ConfigManager:
         return self.config.get(key, default)
 
 
+class TTLCache:
+    """Small in-process cache with per-entry TTL and hit/miss counters"""
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[float, object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple):
+        """Return the cached value for key, or None if missing/expired"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def set(self, key: Tuple, value, ttl: float):
+        """Store value under key for ttl seconds"""
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+
 class MarketDataFetcher:
     """Fetches real-time market data from multiple sources"""
-    
+
+    # TTL aligned to the 1 s fetch throttle: within it, ticks are identical
+    PRICE_TTL = 1.0
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.alpha_vantage_key = config.get('alpha_vantage_api_key')
         self.finnhub_key = config.get('finnhub_api_key', 'demo')
         self.polygon_key = config.get('polygon_api_key')
-        self.last_fetch_time = 0
         self.min_fetch_interval = 1  # Minimum 1 second between fetches
-    
-    def get_live_price(self, symbol: str = "XAUUSD") -> Optional[Dict]:
+        # Quote URLs are fixed per configuration; build them once so each
+        # fetch reuses the exact same string (and connection-pool key)
+        self._av_url = (
+            f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol=XAUUSD&apikey={self.alpha_vantage_key}"
+            if self.alpha_vantage_key else None
+        )
+        self._finnhub_url = f"https://finnhub.io/api/v1/quote?symbol=OANDA:XAU_USD&token={self.finnhub_key}"
+        self._next_allowed = 0.0  # Monotonic deadline for the next fetch
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.cache = TTLCache()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._hist_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        # Pooled session for the synchronous history fetches: keep-alive
+        # avoids a fresh TCP+TLS handshake per request
+        self.av_session = requests.Session()
+        self.av_session.headers['Connection'] = 'keep-alive'
+        self.av_session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        ))
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        # Created lazily so the session is bound to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP sessions"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self.av_session.close()
+
+    async def get_live_price(self, symbol: str = "XAUUSD") -> Optional[Tick]:
         """
-        Get live price from MT5 first, fallback to free APIs
-        Returns: {price, bid, ask, timestamp} or None
+        Get live price from MT5 and free APIs, queried concurrently
+        Served from a short TTL cache; concurrent callers share one fetch
+        Returns: Tick(price, bid, ask, timestamp, source) or None
         """
-        # Throttle requests
-        current_time = time.time()
-        if current_time - self.last_fetch_time < self.min_fetch_interval:
-            time.sleep(self.min_fetch_interval - (current_time - self.last_fetch_time))
-        
-        self.last_fetch_time = time.time()
-        
-        # Priority 1: MT5 Terminal (fastest, most accurate)
-        mt5_price = self._fetch_from_mt5(symbol)
-        if mt5_price:
-            logger.debug(f"Price from MT5: {mt5_price['price']}")
-            return mt5_price
-        
-        # Priority 2: Alpha Vantage (free, reliable)
+        cached = self.cache.get(('live_price', symbol))
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent identical fetches onto one underlying call
+        inflight = self._inflight.get(symbol)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[symbol] = future
+        try:
+            price = await self._fetch_live_price(symbol)
+            if price:
+                self.cache.set(('live_price', symbol), price, self.PRICE_TTL)
+            future.set_result(price)
+            return price
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(symbol, None)
+
+    async def _fetch_live_price(self, symbol: str) -> Optional[Tick]:
+        """Fetch live price from all sources, first success wins"""
+        # Throttle against a monotonic deadline: immune to wall-clock jumps,
+        # and the await lets the event loop service other IO meanwhile
+        sleep_for = self._next_allowed - time.monotonic()
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+        self._next_allowed = time.monotonic() + self.min_fetch_interval
+
+        # Fire all sources in parallel: MT5 terminal (blocking SDK, run in a
+        # thread) plus the HTTP fallbacks. First successful response wins, so
+        # worst-case latency is max(timeouts) instead of their sum.
+        tasks = [asyncio.ensure_future(asyncio.to_thread(self._fetch_from_mt5, symbol))]
         if self.alpha_vantage_key:
-            av_price = self._fetch_from_alpha_vantage(symbol)
-            if av_price:
-                logger.debug(f"Price from Alpha Vantage: {av_price['price']}")
-                return av_price
-        
-        # Priority 3: Finnhub (free tier available)
-        finnhub_price = self._fetch_from_finnhub(symbol)
-        if finnhub_price:
-            logger.debug(f"Price from Finnhub: {finnhub_price['price']}")
-            return finnhub_price
-        
+            tasks.append(asyncio.ensure_future(self._fetch_from_alpha_vantage(symbol)))
+        tasks.append(asyncio.ensure_future(self._fetch_from_finnhub(symbol)))
+
+        result = None
+        try:
+            for completed in asyncio.as_completed(tasks):
+                price = await completed
+                if price:
+                    logger.debug(f"Price from {price.source}: {price.price}")
+                    result = price
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if result:
+            return result
+
         logger.error("All market data sources failed")
         return None
     
-    def _fetch_from_mt5(self, symbol: str) -> Optional[Dict]:
+    def _fetch_from_mt5(self, symbol: str) -> Optional[Tick]:
         """Fetch live tick from MT5"""
         try:
-            if not mt5.initialize():
+            if not _ensure_mt5():
                 return None
-            
+
             tick = mt5.symbol_info_tick(symbol)
             if tick is None:
                 return None
             
-            return {
-                'price': (tick.bid + tick.ask) / 2,
-                'bid': tick.bid,
-                'ask': tick.ask,
-                'timestamp': tick.time,
-                'source': 'MT5'
-            }
+            return Tick((tick.bid + tick.ask) / 2, tick.bid, tick.ask, tick.time, 'MT5')
         except Exception as e:
             logger.debug(f"MT5 fetch error: {e}")
             return None
     
-    def _fetch_from_alpha_vantage(self, symbol: str) -> Optional[Dict]:
+    async def _fetch_from_alpha_vantage(self, symbol: str) -> Optional[Tick]:
         """Fetch from Alpha Vantage Global Quote"""
         try:
-            url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol=XAUUSD&apikey={self.alpha_vantage_key}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
+            session = await self._get_session()
+            async with session.get(self._av_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    return None
+                data = _json_loads(await response.read())
+
             if "Global Quote" not in data or not data["Global Quote"]:
                 return None
             
@@ -140,88 +347,105 @@ class MarketDataFetcher:
             if price == 0:
                 return None
             
-            return {
-                'price': price,
-                'bid': price - 0.5,
-                'ask': price + 0.5,
-                'timestamp': int(time.time()),
-                'source': 'AlphaVantage'
-            }
+            return Tick(price, price - 0.5, price + 0.5, int(time.time()), 'AlphaVantage')
         except Exception as e:
             logger.debug(f"Alpha Vantage fetch error: {e}")
             return None
     
-    def _fetch_from_finnhub(self, symbol: str) -> Optional[Dict]:
+    async def _fetch_from_finnhub(self, symbol: str) -> Optional[Tick]:
         """Fetch from Finnhub quote API"""
         try:
-            url = f"https://finnhub.io/api/v1/quote?symbol=OANDA:XAU_USD&token={self.finnhub_key}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
+            session = await self._get_session()
+            async with session.get(self._finnhub_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    return None
+                data = _json_loads(await response.read())
             price = data.get('c', 0)  # Current price
             
             if price == 0:
                 return None
             
-            return {
-                'price': price,
-                'bid': price - 0.5,
-                'ask': price + 0.5,
-                'timestamp': int(time.time()),
-                'source': 'Finnhub'
-            }
+            return Tick(price, price - 0.5, price + 0.5, int(time.time()), 'Finnhub')
         except Exception as e:
             logger.debug(f"Finnhub fetch error: {e}")
             return None
     
     def get_historical_data(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[pd.DataFrame]:
-        """Get historical candlestick data"""
+        """Get historical candlestick data (cached; only the tail bars
+        are re-fetched while the cached window is still current)"""
+        key = (symbol, timeframe)
+        entry = self._hist_cache.get(key)
+        # Only MT5-sourced windows are tail-refreshed: splicing MT5 bars
+        # onto an Alpha Vantage frame would mix column layouts (tick_volume
+        # vs volume) and NaN-pad both, so fallback data takes a full refetch
+        if entry is not None:
+            cached, source = entry
+            if source == 'MT5' and len(cached) >= limit:
+                refreshed = self._refresh_history_tail(symbol, timeframe, cached)
+                if refreshed is not None:
+                    self._hist_cache[key] = (refreshed, 'MT5')
+                    return refreshed.iloc[-limit:].reset_index(drop=True)
+
         # Try MT5 first
         mt5_data = self._fetch_mt5_history(symbol, timeframe, limit)
         if mt5_data is not None:
+            self._hist_cache[key] = (mt5_data, 'MT5')
             return mt5_data
-        
+
         # Fallback to Alpha Vantage
         if self.alpha_vantage_key:
             av_data = self._fetch_av_history(symbol, timeframe, limit)
             if av_data is not None:
+                self._hist_cache[key] = (av_data, 'AlphaVantage')
                 return av_data
-        
+
         logger.error("Failed to fetch historical data from all sources")
         return None
+
+    def _refresh_history_tail(self, symbol: str, timeframe: str,
+                              cached: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Fetch just the two newest bars and splice them onto the cached
+        window; returns None if the cache is stale by more than one bar"""
+        tail = self._fetch_mt5_history(symbol, timeframe, 2)
+        if tail is None or tail.empty:
+            return None
+
+        # If the oldest fetched bar is newer than everything cached, more
+        # than one bar has elapsed — caller should do a full refetch
+        splice_time = tail['time'].iloc[0]
+        if splice_time > cached['time'].iloc[-1]:
+            return None
+
+        spliced = pd.concat(
+            [cached[cached['time'] < splice_time], tail],
+            ignore_index=True
+        )
+        # Trim back to the original window size: each bar close adds one
+        # row, and without a bound the cached frame (and the per-call
+        # concat copy) would grow forever in a long-running process
+        if len(spliced) > len(cached):
+            spliced = spliced.iloc[-len(cached):].reset_index(drop=True)
+        return spliced
     
     def _fetch_mt5_history(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
         """Fetch historical data from MT5"""
         try:
-            if not mt5.initialize():
+            if not _ensure_mt5():
                 return None
-            
-            # Map timeframe strings to MT5 constants
-            timeframe_map = {
-                '1m': mt5.TIMEFRAME_M1,
-                '5m': mt5.TIMEFRAME_M5,
-                '15m': mt5.TIMEFRAME_M15,
-                '30m': mt5.TIMEFRAME_M30,
-                '1h': mt5.TIMEFRAME_H1,
-                '4h': mt5.TIMEFRAME_H4,
-                '1d': mt5.TIMEFRAME_D1
-            }
-            
-            mt5_timeframe = timeframe_map.get(timeframe, mt5.TIMEFRAME_H1)
+
+            mt5_timeframe = _TIMEFRAME_MAP.get(timeframe, mt5.TIMEFRAME_H1)
             
             rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, limit)
             
             if rates is None or len(rates) == 0:
                 return None
-            
-            df = pd.DataFrame(rates)
+
+            # rates is a numpy structured array: select the wanted fields
+            # before building the frame so only one table is allocated
+            df = pd.DataFrame(rates[['time', 'open', 'high', 'low', 'close', 'tick_volume']])
             df['time'] = pd.to_datetime(df['time'], unit='s')
-            df.columns = ['time', 'open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume']
-            
-            return df[['time', 'open', 'high', 'low', 'close', 'tick_volume']]
+
+            return df
         
         except Exception as e:
             logger.debug(f"MT5 history fetch error: {e}")
@@ -238,12 +462,12 @@ class MarketDataFetcher:
                 function = "FX_DAILY"
                 url = f"https://www.alphavantage.co/query?function={function}&from_symbol=XAU&to_symbol=USD&apikey={self.alpha_vantage_key}&outputsize=full"
             
-            response = requests.get(url, timeout=10)
+            response = self.av_session.get(url, timeout=10)
             
             if response.status_code != 200:
                 return None
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Find time series key
             time_series_key = next((k for k in data.keys() if 'Time Series' in k), None)
@@ -252,22 +476,20 @@ class MarketDataFetcher:
                 return None
             
             time_series = data[time_series_key]
-            
-            # Convert to DataFrame
-            df_data = []
-            for timestamp, values in list(time_series.items())[:limit]:
-                df_data.append({
-                    'time': pd.to_datetime(timestamp),
-                    'open': float(values['1. open']),
-                    'high': float(values['2. high']),
-                    'low': float(values['3. low']),
-                    'close': float(values['4. close']),
-                    'volume': 0
-                })
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('time').reset_index(drop=True)
-            
+
+            # Build the frame in one shot: pandas' C parsers replace the
+            # per-row float()/to_datetime() Python loop, and only one
+            # DataFrame is materialized
+            df = pd.DataFrame.from_dict(time_series, orient='index')
+            df = df.iloc[:limit][['1. open', '2. high', '3. low', '4. close']]
+            df.columns = ['open', 'high', 'low', 'close']
+            df = df.astype(np.float64)
+            # One vectorized parse over all timestamps; the explicit format
+            # pins pandas to its C fast path instead of per-call inference
+            df.index = pd.to_datetime(df.index, format='ISO8601')
+            df = df.sort_index().reset_index().rename(columns={'index': 'time'})
+            df['volume'] = 0
+
             return df
         
         except Exception as e:
@@ -277,14 +499,58 @@ class MarketDataFetcher:
 
 class MT5Executor:
     """Handles real MT5 trade execution"""
-    
+
+    # TTLs aligned to how fast these values actually move between ticks
+    ACCOUNT_INFO_TTL = 5.0
+    POSITIONS_TTL = 2.0
+    TICK_TTL = 0.2
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.login = config.get('mt5_login')
         self.password = config.get('mt5_password')
         self.server = config.get('mt5_server')
         self.magic_number = config.get('magic_number', 234000)
+        self.symbol = config.get('symbol', 'XAUUSD')
         self.initialized = False
+        self.cache = TTLCache()
+        # Order-request templates for the configured symbol: the static
+        # fields are resolved once here, so the fast-path order methods
+        # only fill in the volatile ones (volume/price/sl/tp/comment)
+        base_request = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": self.symbol,
+            "deviation": 20,
+            "magic": self.magic_number,
+            "type_time": mt5.ORDER_TIME_GTC,
+            "type_filling": mt5.ORDER_FILLING_IOC,
+        }
+        self._buy_template = dict(base_request, type=mt5.ORDER_TYPE_BUY)
+        self._sell_template = dict(base_request, type=mt5.ORDER_TYPE_SELL)
+        # Per-symbol caches over the MT5 IPC boundary: ticks go stale in
+        # TICK_TTL, symbol specs are stable for the session
+        self._tick_cache: Dict[str, Tuple[float, object]] = {}
+        self._symbol_info_cache: Dict[str, object] = {}
+
+    def _get_tick(self, symbol: str):
+        """Get the current tick, cached for TICK_TTL seconds"""
+        cached = self._tick_cache.get(symbol)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.TICK_TTL:
+            return cached[1]
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is not None:
+            self._tick_cache[symbol] = (now, tick)
+        return tick
+
+    def _get_symbol_info(self, symbol: str):
+        """Get symbol specification, memoized for the session"""
+        info = self._symbol_info_cache.get(symbol)
+        if info is None:
+            info = mt5.symbol_info(symbol)
+            if info is not None:
+                self._symbol_info_cache[symbol] = info
+        return info
     
     def initialize(self) -> bool:
         """Initialize MT5 connection"""
@@ -308,31 +574,39 @@ class MT5Executor:
             else:
                 logger.info("Connected to MT5 (using currently logged-in account)")
             
+            global _mt5_ready
+            _mt5_ready = True
             self.initialized = True
             return True
-        
+
         except Exception as e:
             logger.error(f"MT5 initialization error: {e}")
             return False
-    
+
     def shutdown(self):
         """Shutdown MT5 connection"""
+        global _mt5_ready
         if self.initialized:
             mt5.shutdown()
             self.initialized = False
+            _mt5_ready = False
             logger.info("MT5 connection closed")
     
     def get_account_info(self) -> Optional[Dict]:
-        """Get account information"""
+        """Get account information (cached for ACCOUNT_INFO_TTL seconds)"""
+        cached = self.cache.get(('account_info',))
+        if cached is not None:
+            return cached
+
         if not self.initialize():
             return None
-        
+
         try:
             account_info = mt5.account_info()
             if account_info is None:
                 return None
-            
-            return {
+
+            info = {
                 'balance': account_info.balance,
                 'equity': account_info.equity,
                 'margin': account_info.margin,
@@ -342,16 +616,18 @@ class MT5Executor:
                 'leverage': account_info.leverage,
                 'currency': account_info.currency
             }
+            self.cache.set(('account_info',), info, self.ACCOUNT_INFO_TTL)
+            return info
         except Exception as e:
             logger.error(f"Error getting account info: {e}")
             return None
     
     def open_position(self, symbol: str, order_type: str, volume: float, 
-                     sl: float = 0, tp: float = 0, comment: str = "") -> Optional[Dict]:
+                     sl: float = 0, tp: float = 0, comment: str = "") -> Optional[OrderResult]:
         """
         Open a new position
         order_type: 'buy' or 'sell'
-        Returns: order result dict or None
+        Returns: OrderResult or None
         """
         if not self.initialize():
             logger.error("Cannot open position: MT5 not initialized")
@@ -359,7 +635,7 @@ class MT5Executor:
         
         try:
             # Get symbol info
-            symbol_info = mt5.symbol_info(symbol)
+            symbol_info = self._get_symbol_info(symbol)
             if symbol_info is None:
                 logger.error(f"Symbol {symbol} not found")
                 return None
@@ -370,7 +646,7 @@ class MT5Executor:
                     return None
             
             # Get current price
-            tick = mt5.symbol_info_tick(symbol)
+            tick = self._get_tick(symbol)
             if tick is None:
                 logger.error(f"Failed to get tick for {symbol}")
                 return None
@@ -413,24 +689,97 @@ class MT5Executor:
                 logger.error(f"Order failed, retcode={result.retcode}, comment={result.comment}")
                 return None
             
-            logger.info(f"Position opened: {order_type.upper()} {volume} {symbol} at {price}")
+            logger.info("Position opened: %s %s %s at %s",
+                        order_type.upper(), volume, symbol, price)
             
-            return {
-                'ticket': result.order,
-                'volume': result.volume,
-                'price': result.price,
-                'type': order_type,
-                'symbol': symbol,
-                'sl': sl,
-                'tp': tp,
-                'comment': comment,
-                'timestamp': datetime.now()
-            }
+            return OrderResult(
+                result.order, result.volume, result.price, order_type,
+                symbol, sl, tp, comment, datetime.now()
+            )
         
         except Exception as e:
             logger.error(f"Error opening position: {e}")
             return None
-    
+
+    def open_buy_fast(self, volume: float, sl: float = 0, tp: float = 0,
+                      comment: str = "") -> Optional[OrderResult]:
+        """Fast-path buy on the configured symbol using the prebuilt template"""
+        return self._open_fast(self._buy_template, 'buy', volume, sl, tp, comment)
+
+    def open_sell_fast(self, volume: float, sl: float = 0, tp: float = 0,
+                       comment: str = "") -> Optional[OrderResult]:
+        """Fast-path sell on the configured symbol using the prebuilt template"""
+        return self._open_fast(self._sell_template, 'sell', volume, sl, tp, comment)
+
+    def _open_fast(self, template: Dict, order_type: str, volume: float,
+                   sl: float, tp: float, comment: str) -> Optional[OrderResult]:
+        """
+        Open a position on the configured symbol from a request template
+        Skips the per-call symbol lookup/selection the generic path does;
+        assumes the configured symbol is already selected in the terminal
+        """
+        if not self.initialize():
+            logger.error("Cannot open position: MT5 not initialized")
+            return None
+
+        tick = self._get_tick(self.symbol)
+        if tick is None:
+            logger.error(f"Failed to get tick for {self.symbol}")
+            return None
+
+        request = template.copy()
+        request.update(
+            volume=volume,
+            price=tick.ask if order_type == 'buy' else tick.bid,
+            sl=sl,
+            tp=tp,
+            comment=comment
+        )
+
+        result = mt5.order_send(request)
+
+        if result is None:
+            logger.error("order_send failed, result is None")
+            return None
+
+        if result.retcode != mt5.TRADE_RETCODE_DONE:
+            logger.error(f"Order failed, retcode={result.retcode}, comment={result.comment}")
+            return None
+
+        logger.info("Position opened: %s %s %s at %s",
+                    order_type.upper(), volume, self.symbol, request['price'])
+
+        return OrderResult(
+            result.order, result.volume, result.price, order_type,
+            self.symbol, sl, tp, comment, datetime.now()
+        )
+
+    def open_positions_batch(self, order_requests: List[Dict]) -> List[Optional[OrderResult]]:
+        """
+        Submit several orders with overlapping broker round-trips
+        Each entry is a dict of open_position keyword arguments; results
+        come back in input order, None where a submission failed
+        The Python MT5 API has no bulk order call, so the batch win comes
+        from firing all blocking order_send round-trips concurrently:
+        wall time is ~1 round-trip instead of one per order
+        """
+        if not order_requests:
+            return []
+
+        if not self.initialize():
+            logger.error("Cannot open positions: MT5 not initialized")
+            return [None] * len(order_requests)
+
+        if len(order_requests) == 1:
+            return [self.open_position(**order_requests[0])]
+
+        with ThreadPoolExecutor(max_workers=min(len(order_requests), 8)) as pool:
+            return list(pool.map(lambda kwargs: self.open_position(**kwargs), order_requests))
+
+    async def open_positions_batch_async(self, order_requests: List[Dict]) -> List[Optional[OrderResult]]:
+        """Async wrapper running the batch submission off the event loop"""
+        return await asyncio.to_thread(self.open_positions_batch, order_requests)
+
     def close_position(self, ticket: int) -> bool:
         """Close position by ticket"""
         if not self.initialize():
@@ -450,12 +799,15 @@ class MT5Executor:
             volume = position.volume
             
             # Determine close type (opposite of position type)
+            tick = self._get_tick(symbol)
+            if tick is None:
+                logger.error(f"Failed to get tick for {symbol}")
+                return False
+
             if position.type == mt5.ORDER_TYPE_BUY:
-                trade_type = mt5.ORDER_TYPE_SELL
-                price = mt5.symbol_info_tick(symbol).bid
+                trade_type, price = mt5.ORDER_TYPE_SELL, tick.bid
             else:
-                trade_type = mt5.ORDER_TYPE_BUY
-                price = mt5.symbol_info_tick(symbol).ask
+                trade_type, price = mt5.ORDER_TYPE_BUY, tick.ask
             
             request = {
                 "action": mt5.TRADE_ACTION_DEAL,
@@ -484,11 +836,15 @@ class MT5Executor:
             logger.error(f"Error closing position: {e}")
             return False
     
-    def get_open_positions(self, symbol: str = None) -> List[Dict]:
-        """Get all open positions"""
+    def get_open_positions(self, symbol: str = None) -> List[Position]:
+        """Get all open positions (cached for POSITIONS_TTL seconds)"""
+        cached = self.cache.get(('positions', symbol))
+        if cached is not None:
+            return cached
+
         if not self.initialize():
             return []
-        
+
         try:
             if symbol:
                 positions = mt5.positions_get(symbol=symbol)
@@ -497,28 +853,38 @@ class MT5Executor:
             
             if positions is None:
                 return []
-            
-            return [
-                {
-                    'ticket': pos.ticket,
-                    'symbol': pos.symbol,
-                    'type': 'buy' if pos.type == mt5.ORDER_TYPE_BUY else 'sell',
-                    'volume': pos.volume,
-                    'open_price': pos.price_open,
-                    'current_price': pos.price_current,
-                    'sl': pos.sl,
-                    'tp': pos.tp,
-                    'profit': pos.profit,
-                    'comment': pos.comment,
-                    'open_time': datetime.fromtimestamp(pos.time)
-                }
+
+            result = [
+                Position(
+                    pos.ticket,
+                    pos.symbol,
+                    'buy' if pos.type == mt5.ORDER_TYPE_BUY else 'sell',
+                    pos.volume,
+                    pos.price_open,
+                    pos.price_current,
+                    pos.sl,
+                    pos.tp,
+                    pos.profit,
+                    pos.comment,
+                    pos.time
+                )
                 for pos in positions
             ]
-        
+            self.cache.set(('positions', symbol), result, self.POSITIONS_TTL)
+            return result
+
         except Exception as e:
             logger.error(f"Error getting positions: {e}")
             return []
 
+    async def get_account_info_async(self) -> Optional[Dict]:
+        """Async wrapper running the blocking MT5 call in a thread"""
+        return await asyncio.to_thread(self.get_account_info)
+
+    async def get_open_positions_async(self, symbol: str = None) -> List[Position]:
+        """Async wrapper running the blocking MT5 call in a thread"""
+        return await asyncio.to_thread(self.get_open_positions, symbol)
+
 
 class RiskManager:
     """Manages position sizing and risk parameters"""
@@ -533,70 +899,97 @@ class RiskManager:
         self.daily_trades = 0
         self.day_start_balance = 0
     
-    def calculate_position_size(self, account_balance: float, entry_price: float, 
-                               stop_loss: float, symbol: str = "XAUUSD") -> float:
+    def calculate_position_size_batch(self, balances: np.ndarray, entries: np.ndarray,
+                                      sls: np.ndarray) -> np.ndarray:
         """
-        Calculate position size based on risk parameters
-        Returns: lot size
+        Vectorized position sizing over parallel arrays of account
+        balances, entry prices and stop losses
+        Returns: array of lot sizes (0 where SL equals entry)
         """
         try:
+            balances = np.asarray(balances, dtype=np.float64)
+            entries = np.asarray(entries, dtype=np.float64)
+            sls = np.asarray(sls, dtype=np.float64)
+
             # Risk amount in account currency
-            risk_amount = account_balance * self.max_risk_per_trade
-            
+            risk_amounts = balances * self.max_risk_per_trade
+
             # Points at risk
-            points_at_risk = abs(entry_price - stop_loss)
-            
-            if points_at_risk == 0:
-                logger.warning("Stop loss equals entry price, cannot calculate position size")
-                return 0
-            
+            points_at_risk = np.abs(entries - sls)
+
             # For XAUUSD, 1 lot = 100 oz, 1 point = $0.01 per oz
             # Value per lot per point = 100 * 0.01 = $1
             value_per_point = 1.0  # For XAUUSD
-            
-            # Calculate lot size
-            lot_size = risk_amount / (points_at_risk * value_per_point)
-            
-            # Round to 2 decimals (standard lot size precision)
-            lot_size = round(lot_size, 2)
-            
-            # Apply min/max lot size
+
+            # Apply min/max lot size (2-decimal standard lot precision)
             min_lot = self.config.get('min_lot_size', 0.01)
             max_lot = self.config.get('max_lot_size', 10.0)
-            
-            lot_size = max(min_lot, min(lot_size, max_lot))
-            
-            logger.info(f"Calculated position size: {lot_size} lots (risk: ${risk_amount:.2f})")
-            
-            return lot_size
-        
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lots = np.round(risk_amounts / (points_at_risk * value_per_point), 2)
+
+            return np.where(points_at_risk == 0, 0.0, np.clip(lots, min_lot, max_lot))
+
         except Exception as e:
-            logger.error(f"Error calculating position size: {e}")
+            logger.error(f"Error calculating batch position size: {e}")
+            return np.zeros_like(np.atleast_1d(entries), dtype=np.float64)
+
+    def calculate_position_size(self, account_balance: float, entry_price: float,
+                               stop_loss: float, symbol: str = "XAUUSD") -> float:
+        """
+        Calculate position size based on risk parameters
+        Returns: lot size
+        """
+        lot_size = _position_size(
+            float(account_balance), float(entry_price), float(stop_loss),
+            _VALUE_PER_POINT.get(symbol, 1.0), self.max_risk_per_trade
+        )
+
+        if lot_size == 0:
+            logger.warning("Stop loss equals entry price, cannot calculate position size")
             return 0
+
+        # Round to 2 decimals (standard lot size precision) and clip
+        lot_size = round(lot_size, 2)
+        min_lot = self.config.get('min_lot_size', 0.01)
+        max_lot = self.config.get('max_lot_size', 10.0)
+        lot_size = max(min_lot, min(lot_size, max_lot))
+
+        risk_amount = account_balance * self.max_risk_per_trade
+        logger.info("Calculated position size: %s lots (risk: $%.2f)", lot_size, risk_amount)
+
+        return lot_size
     
     def check_trading_allowed(self, account_info: Dict) -> Tuple[bool, str]:
         """Check if trading is allowed based on risk rules"""
-        
-        # Initialize day tracking
+        # Pull the fields into locals once; this runs every tick
+        balance = account_info['balance']
+        equity = account_info['equity']
+        margin_level = account_info['margin_level']
+
+        # Initialize day tracking before any early return: the session's
+        # first calls may be rejected on margin, and seeding the day-start
+        # balance later from a different balance would skew the daily-loss
+        # checks for the rest of the day
         if self.day_start_balance == 0:
-            self.day_start_balance = account_info['balance']
-        
+            self.day_start_balance = balance
+
+        # Check margin level first: cheapest test, most likely to reject
+        if margin_level < 200:
+            return False, f"Margin level too low: {margin_level:.2f}%"
+
         # Check daily loss limit
-        current_daily_loss = (self.day_start_balance - account_info['balance']) / self.day_start_balance
-        
+        current_daily_loss = (self.day_start_balance - balance) * (1.0 / self.day_start_balance)
+
         if current_daily_loss >= self.max_daily_loss:
             return False, f"Daily loss limit reached: {current_daily_loss*100:.2f}%"
-        
+
         # Check drawdown
-        drawdown = (account_info['balance'] - account_info['equity']) / account_info['balance']
-        
+        drawdown = (balance - equity) * (1.0 / balance)
+
         if drawdown >= self.max_drawdown:
             return False, f"Max drawdown reached: {drawdown*100:.2f}%"
-        
-        # Check margin level
-        if account_info['margin_level'] < 200:
-            return False, f"Margin level too low: {account_info['margin_level']:.2f}%"
-        
+
         return True, "Trading allowed"
     
     def reset_daily_stats(self):
@@ -609,69 +1002,184 @@ class RiskManager:
 
 class TradeLogger:
     """Logs all trades and system events to CSV"""
-    
+
+    FLUSH_INTERVAL = 0.5  # seconds a row may sit in the queue before flush
+
+    _STOP = object()  # queue sentinel: tells the drain thread to exit
+
     def __init__(self, trades_file: str = "trades.csv", events_file: str = "events.csv"):
         self.trades_file = trades_file
         self.events_file = events_file
         self._ensure_files_exist()
-    
+        # Long-lived handles + a background drain thread: log calls become a
+        # queue put, and rows are written in batches instead of one
+        # open/write/close cycle per event
+        self._trades_fh = Path(self.trades_file).open('a', newline='', buffering=1 << 16)
+        self._events_fh = Path(self.events_file).open('a', newline='', buffering=1 << 16)
+        self._queue = queue.Queue()
+        self._write_lock = threading.Lock()
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
+        atexit.register(self.flush)
+
     def _ensure_files_exist(self):
         """Create CSV files with headers if they don't exist"""
         # Trades file
-        if not os.path.exists(self.trades_file):
-            with open(self.trades_file, 'w', newline='') as f:
+        if not Path(self.trades_file).exists():
+            with Path(self.trades_file).open('w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow([
                     'timestamp', 'ticket', 'symbol', 'type', 'volume', 'entry_price',
                     'exit_price', 'sl', 'tp', 'profit', 'comment', 'status'
                 ])
-        
+
         # Events file
-        if not os.path.exists(self.events_file):
-            with open(self.events_file, 'w', newline='') as f:
+        if not Path(self.events_file).exists():
+            with Path(self.events_file).open('w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(['timestamp', 'event_type', 'description', 'data'])
     
+    def log_row(self, row: Tuple):
+        """
+        Queue a fixed-order trade row for the background writer
+        Column order matches the trades.csv header: (timestamp, ticket,
+        symbol, type, volume, entry_price, exit_price, sl, tp, profit,
+        comment, status)
+        """
+        self._queue.put(('trade', list(row)))
+
     def log_trade(self, trade_data: Dict):
-        """Log a trade to CSV"""
-        try:
-            with open(self.trades_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    trade_data.get('timestamp', datetime.now()),
-                    trade_data.get('ticket', ''),
-                    trade_data.get('symbol', ''),
-                    trade_data.get('type', ''),
-                    trade_data.get('volume', 0),
-                    trade_data.get('entry_price', 0),
-                    trade_data.get('exit_price', 0),
-                    trade_data.get('sl', 0),
-                    trade_data.get('tp', 0),
-                    trade_data.get('profit', 0),
-                    trade_data.get('comment', ''),
-                    trade_data.get('status', '')
-                ])
-        except Exception as e:
-            logger.error(f"Error logging trade: {e}")
-    
+        """Queue a trade row from a dict; log_row is the hot-path variant"""
+        self.log_row((
+            trade_data.get('timestamp'),
+            trade_data.get('ticket', ''),
+            trade_data.get('symbol', ''),
+            trade_data.get('type', ''),
+            trade_data.get('volume', 0),
+            trade_data.get('entry_price', 0),
+            trade_data.get('exit_price', 0),
+            trade_data.get('sl', 0),
+            trade_data.get('tp', 0),
+            trade_data.get('profit', 0),
+            trade_data.get('comment', ''),
+            trade_data.get('status', '')
+        ))
+
     def log_event(self, event_type: str, description: str, data: Dict = None):
-        """Log a system event to CSV"""
+        """Queue a system event row for the background writer; the data
+        payload is serialized by the drain thread, off the trading path"""
+        self._queue.put(('event', [None, event_type, description, data]))
+
+    def _drain(self):
+        """Background thread: gather queued rows and write them in batches
+        until the stop sentinel arrives"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while True:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    # Finish writing the rows gathered so far, then exit
+                    stopping = True
+                    break
+                batch.append(item)
+            # The drain thread must survive anything: if it dies, logging
+            # silently piles up in the queue with nothing ever written
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error("Error draining log batch: %s", e)
+
+    def _write_batch(self, batch: List[Tuple[str, List]]):
+        """Write a batch of (kind, row) entries to their CSV files
+        Serialized by a lock: the drain thread and a shutdown flush must
+        never interleave batches on the same handles"""
+        # Format the timestamp once per batch rather than per row; rows
+        # with an explicit timestamp (e.g. order fill time) keep theirs
+        batch_ts = datetime.now().isoformat()
+        for _, row in batch:
+            if row[0] is None:
+                row[0] = batch_ts
+
+        trades = [row for kind, row in batch if kind == 'trade']
+        events = [row for kind, row in batch if kind == 'event']
+        # Serialize per row so one unserializable payload can't take down
+        # the whole batch (or the drain thread carrying it)
+        for row in events:
+            try:
+                row[3] = _json_dumps(row[3]) if row[3] else ''
+            except (TypeError, ValueError):
+                row[3] = repr(row[3])
+        # Render each batch into one contiguous buffer first, so the flush
+        # is a single gathered write syscall per file regardless of how
+        # many rows the batch holds
         try:
-            with open(self.events_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now(),
-                    event_type,
-                    description,
-                    json.dumps(data) if data else ''
-                ])
+            with self._write_lock:
+                if trades:
+                    self._trades_fh.write(self._render_rows(trades))
+                    self._trades_fh.flush()
+                if events:
+                    self._events_fh.write(self._render_rows(events))
+                    self._events_fh.flush()
         except Exception as e:
-            logger.error(f"Error logging event: {e}")
+            logger.error(f"Error writing log batch: {e}")
+
+    @staticmethod
+    def _render_rows(rows: List[List]) -> str:
+        """Serialize rows to one CSV string"""
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        return buf.getvalue()
+
+    def flush(self):
+        """Stop the drain thread and write any remaining rows (shutdown
+        path); joining first guarantees its in-flight batch hits the file
+        before we drain the leftovers ourselves"""
+        if self._drain_thread.is_alive():
+            self._queue.put(self._STOP)
+            self._drain_thread.join(timeout=5)
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                batch.append(item)
+        if batch:
+            self._write_batch(batch)
+
+    def close(self):
+        """Flush queued rows and fsync the log files for durability"""
+        self.flush()
+        for fh in (self._trades_fh, self._events_fh):
+            try:
+                fh.flush()
+                os.fsync(fh.fileno())
+            except (OSError, ValueError):
+                pass
 
 
 class TradingSystem:
     """Main trading system orchestrator"""
-    
+
+    # Fixed attribute layout: skips the per-instance __dict__, shrinking the
+    # object and turning hot-loop attribute loads into fixed-offset reads
+    __slots__ = ('config', 'market_data', 'executor', 'risk_manager',
+                 'trade_logger', 'running', 'last_price_check',
+                 'price_check_interval', '_sl_pts', '_tp_pts',
+                 '_risk_pct', '_min_lot', '_max_lot')
+
     def __init__(self, config_path: str = "config.json"):
         self.config = ConfigManager(config_path)
         self.market_data = MarketDataFetcher(self.config)
@@ -681,13 +1189,39 @@ class TradingSystem:
         self.running = False
         self.last_price_check = 0
         self.price_check_interval = self.config.get('price_check_interval', 5)  # seconds
+        # Hot-path config values resolved once at load: per-trade SL/TP math
+        # becomes an attribute load + add, not a dict lookup per order
+        self._sl_pts = float(self.config.get('default_sl_points', 10))
+        self._tp_pts = float(self.config.get('default_tp_points', 20))
+        self._risk_pct = self.risk_manager.max_risk_per_trade
+        self._min_lot = float(self.config.get('min_lot_size', 0.01))
+        self._max_lot = float(self.config.get('max_lot_size', 10.0))
     
+    def _pin_trading_core(self):
+        """Pin the process to the configured CPU core, if any (Linux)"""
+        core = self.config.get('trading_core')
+        if core is None:
+            return
+
+        if not hasattr(os, 'sched_setaffinity'):
+            logger.warning("trading_core is set but CPU pinning is not supported on this platform")
+            return
+
+        try:
+            os.sched_setaffinity(0, {int(core)})
+            logger.info("Trading process pinned to CPU core %s", core)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to pin trading process to core {core}: {e}")
+
     def start(self):
         """Start the trading system"""
         logger.info("=" * 60)
         logger.info("SENTINEL GOLD TRADER - PRODUCTION SYSTEM STARTING")
         logger.info("=" * 60)
-        
+
+        # Keep the latency-sensitive loop on a dedicated core if configured
+        self._pin_trading_core()
+
         # Initialize MT5
         if not self.executor.initialize():
             logger.error("Failed to initialize MT5. System cannot start.")
@@ -704,9 +1238,9 @@ class TradingSystem:
         self.trade_logger.log_event('SYSTEM_START', 'Trading system started', account_info)
         
         self.running = True
-        
+
         try:
-            self._main_loop()
+            asyncio.run(self._main_loop())
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
         except Exception as e:
@@ -719,166 +1253,212 @@ class TradingSystem:
         logger.info("Stopping trading system...")
         self.running = False
         self.executor.shutdown()
+        self.trade_logger.log_event('CACHE_STATS', 'TTL cache hit/miss counters', {
+            'market_data': self.market_data.cache.stats(),
+            'executor': self.executor.cache.stats()
+        })
         self.trade_logger.log_event('SYSTEM_STOP', 'Trading system stopped')
+        self.trade_logger.close()
         logger.info("Trading system stopped")
     
-    def _main_loop(self):
+    async def _main_loop(self):
         """Main trading loop"""
         symbol = self.config.get('symbol', 'XAUUSD')
-        
+
+        try:
+            await self._run_loop(symbol)
+        finally:
+            await self.market_data.close()
+
+    async def _run_loop(self, symbol: str):
+        """Run trading loop iterations"""
         while self.running:
             try:
                 current_time = time.time()
-                
+
                 # Check if it's time to fetch price
                 if current_time - self.last_price_check < self.price_check_interval:
-                    time.sleep(0.1)
+                    await asyncio.sleep(0.1)
                     continue
-                
+
                 self.last_price_check = current_time
-                
-                # Get live price
-                price_data = self.market_data.get_live_price(symbol)
-                
+
+                # Fetch price, account info and positions concurrently:
+                # tick latency is the slowest of the three, not their sum
+                price_data, account_info, open_positions = await asyncio.gather(
+                    self.market_data.get_live_price(symbol),
+                    self.executor.get_account_info_async(),
+                    self.executor.get_open_positions_async(symbol)
+                )
+
                 if price_data is None:
                     logger.warning("Failed to get live price, retrying...")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
-                
-                logger.info(f"Live {symbol}: {price_data['price']:.2f} (bid: {price_data['bid']:.2f}, ask: {price_data['ask']:.2f}) [Source: {price_data['source']}]")
-                
-                # Get account info
-                account_info = self.executor.get_account_info()
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Live %s: %.2f (bid: %.2f, ask: %.2f) [Source: %s]",
+                                symbol, price_data.price, price_data.bid,
+                                price_data.ask, price_data.source)
+
                 if account_info is None:
                     logger.error("Failed to get account info")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
-                
+
                 # Check if trading is allowed
                 allowed, reason = self.risk_manager.check_trading_allowed(account_info)
-                
+
                 if not allowed:
                     logger.warning(f"Trading not allowed: {reason}")
-                    time.sleep(60)
+                    await asyncio.sleep(60)
                     continue
-                
-                # Get open positions
-                open_positions = self.executor.get_open_positions(symbol)
-                logger.info(f"Open positions: {len(open_positions)}")
-                
+
                 # Monitor open positions
-                for position in open_positions:
-                    logger.info(f"Position {position['ticket']}: {position['type'].upper()} {position['volume']} lots @ {position['open_price']:.2f}, P&L: ${position['profit']:.2f}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Open positions: %d", len(open_positions))
+                    for position in open_positions:
+                        logger.info("Position %s: %s %s lots @ %.2f, P&L: $%.2f",
+                                    position.ticket, position.type.upper(), position.volume,
+                                    position.open_price, position.profit)
                 
                 # Here you would add your trading strategy logic
                 # For now, this is a monitoring system that logs prices and positions
                 # To add trading signals, integrate your strategy here
-                
-                # Example: Simple signal checking placeholder
+
+                # Example: Simple signal checking placeholder. Submissions go
+                # through _execute_trade_async so several orders can be
+                # gathered and their round-trips overlap:
+                # trades = []
                 # if self._check_buy_signal(price_data):
-                #     self._execute_buy(symbol, price_data, account_info)
+                #     trades.append(self._execute_trade_async('buy', symbol, price_data, account_info))
                 # elif self._check_sell_signal(price_data):
-                #     self._execute_sell(symbol, price_data, account_info)
+                #     trades.append(self._execute_trade_async('sell', symbol, price_data, account_info))
+                # if trades:
+                #     await asyncio.gather(*trades, return_exceptions=True)
                 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}", exc_info=True)
-                time.sleep(5)
+                await asyncio.sleep(5)
     
-    def _execute_buy(self, symbol: str, price_data: Dict, account_info: Dict):
-        """Execute a buy trade"""
-        try:
-            # Calculate stop loss and take profit
-            entry_price = price_data['ask']
-            sl = entry_price - self.config.get('default_sl_points', 10)
-            tp = entry_price + self.config.get('default_tp_points', 20)
-            
-            # Calculate position size
-            volume = self.risk_manager.calculate_position_size(
-                account_info['balance'],
-                entry_price,
-                sl,
-                symbol
-            )
-            
+    # side -> (SL/TP sign, entry price field, fast-path method, comment)
+    _SIDES = {
+        'buy': (1.0, 'ask', 'open_buy_fast', 'Auto buy'),
+        'sell': (-1.0, 'bid', 'open_sell_fast', 'Auto sell'),
+    }
+
+    async def _execute_trade_async(self, side: str, symbol: str, price_data: Tick, account_info: Dict):
+        """
+        Submit one trade off the event loop thread
+        Gather several of these to put K orders in flight concurrently:
+        total latency becomes one broker round-trip instead of K
+        """
+        await asyncio.to_thread(self._execute_trade, side, symbol, price_data, account_info)
+
+    async def _execute_trades_batch(self, decisions: List[Tuple[str, str, float]], account_info: Dict):
+        """
+        Submit one tick's multi-symbol decisions as a single batch
+        decisions: (side, symbol, entry_price) triples
+        SL, TP and volume for the whole batch come from one set of
+        vectorized numpy expressions instead of per-symbol scalar math
+        """
+        if not decisions:
+            return
+
+        balance = account_info.get('balance')
+        if balance is None:
+            logger.warning("Incomplete account data, skipping trade batch")
+            return
+
+        sides = [side for side, _, _ in decisions]
+        entries = np.array([entry for _, _, entry in decisions], dtype=np.float64)
+        signs = np.where(np.array(sides) == 'buy', 1.0, -1.0)
+
+        sls = entries - signs * self._sl_pts
+        tps = entries + signs * self._tp_pts
+        balances = np.full(len(decisions), balance, dtype=np.float64)
+        volumes = self.risk_manager.calculate_position_size_batch(balances, entries, sls)
+
+        order_requests = []
+        for (side, symbol, _), sl, tp, volume in zip(decisions, sls, tps, volumes):
             if volume == 0:
-                logger.warning("Position size is zero, skipping trade")
-                return
-            
-            # Execute trade
-            result = self.executor.open_position(
-                symbol=symbol,
-                order_type='buy',
-                volume=volume,
-                sl=sl,
-                tp=tp,
-                comment="Auto buy"
-            )
-            
+                logger.warning("Position size is zero, skipping %s %s", side, symbol)
+                continue
+            order_requests.append({
+                'symbol': symbol,
+                'order_type': side,
+                'volume': float(volume),
+                'sl': float(sl),
+                'tp': float(tp),
+                'comment': self._SIDES[side][3]
+            })
+
+        results = await self.executor.open_positions_batch_async(order_requests)
+
+        for result in results:
             if result:
-                self.trade_logger.log_trade({
-                    'timestamp': result['timestamp'],
-                    'ticket': result['ticket'],
-                    'symbol': symbol,
-                    'type': 'buy',
-                    'volume': volume,
-                    'entry_price': entry_price,
-                    'sl': sl,
-                    'tp': tp,
-                    'status': 'opened'
-                })
-                
-                logger.info(f"BUY ORDER EXECUTED: {volume} lots @ {entry_price}")
-        
-        except Exception as e:
-            logger.error(f"Error executing buy: {e}")
-    
-    def _execute_sell(self, symbol: str, price_data: Dict, account_info: Dict):
-        """Execute a sell trade"""
+                self.trade_logger.log_row((
+                    result.timestamp, result.ticket, result.symbol, result.type,
+                    result.volume, result.price, 0, result.sl, result.tp, 0,
+                    result.comment, 'opened'
+                ))
+                logger.info("%s ORDER EXECUTED: %s lots @ %s",
+                            result.type.upper(), result.volume, result.price)
+
+    def _execute_trade(self, side: str, symbol: str, price_data: Tick, account_info: Dict):
+        """Execute a trade; side is 'buy' or 'sell'"""
+        sign, price_key, fast_method, comment = self._SIDES[side]
+
+        # Validate inputs once up front instead of catching KeyError et al
+        # from halfway through the submission
+        entry_price = getattr(price_data, price_key, None)
+        balance = account_info.get('balance')
+        if entry_price is None or balance is None:
+            logger.warning("Incomplete price/account data, skipping %s", side)
+            return
+
+        # Fused scalar hot path: SL/TP arithmetic, sizing kernel, round/clip
+        # all inline on cached attributes — no intermediate dicts and no
+        # detour through RiskManager's logging wrapper per order
+        sl = entry_price - sign * self._sl_pts
+        tp = entry_price + sign * self._tp_pts
+
+        volume = _position_size(
+            float(balance), float(entry_price), float(sl),
+            _VALUE_PER_POINT.get(symbol, 1.0), self._risk_pct
+        )
+
+        if volume == 0:
+            logger.warning("Position size is zero, skipping trade")
+            return
+
+        volume = max(self._min_lot, min(round(volume, 2), self._max_lot))
+
+        # Execute trade (template fast path for the configured symbol);
+        # only transient transport faults are expected to raise here
         try:
-            # Calculate stop loss and take profit
-            entry_price = price_data['bid']
-            sl = entry_price + self.config.get('default_sl_points', 10)
-            tp = entry_price - self.config.get('default_tp_points', 20)
-            
-            # Calculate position size
-            volume = self.risk_manager.calculate_position_size(
-                account_info['balance'],
-                entry_price,
-                sl,
-                symbol
-            )
-            
-            if volume == 0:
-                logger.warning("Position size is zero, skipping trade")
-                return
-            
-            # Execute trade
-            result = self.executor.open_position(
-                symbol=symbol,
-                order_type='sell',
-                volume=volume,
-                sl=sl,
-                tp=tp,
-                comment="Auto sell"
-            )
-            
-            if result:
-                self.trade_logger.log_trade({
-                    'timestamp': result['timestamp'],
-                    'ticket': result['ticket'],
-                    'symbol': symbol,
-                    'type': 'sell',
-                    'volume': volume,
-                    'entry_price': entry_price,
-                    'sl': sl,
-                    'tp': tp,
-                    'status': 'opened'
-                })
-                
-                logger.info(f"SELL ORDER EXECUTED: {volume} lots @ {entry_price}")
-        
-        except Exception as e:
-            logger.error(f"Error executing sell: {e}")
+            if symbol == self.executor.symbol:
+                result = getattr(self.executor, fast_method)(volume, sl=sl, tp=tp, comment=comment)
+            else:
+                result = self.executor.open_position(
+                    symbol=symbol,
+                    order_type=side,
+                    volume=volume,
+                    sl=sl,
+                    tp=tp,
+                    comment=comment
+                )
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.error("Transient error submitting %s order: %s", side, e)
+            return
+
+        if result:
+            self.trade_logger.log_row((
+                result.timestamp, result.ticket, symbol, side, volume,
+                entry_price, 0, sl, tp, 0, comment, 'opened'
+            ))
+
+            logger.info("%s ORDER EXECUTED: %s lots @ %s", side.upper(), volume, entry_price)
 
 
 def main():
@@ -892,12 +1472,8 @@ def main():
 ╚════════════════════════════════════════════════════════════╝
     """)
     
-    # Check if config exists
-    if not os.path.exists('config.json'):
-        logger.error("config.json not found. Please create it first.")
-        sys.exit(1)
-    
-    # Start trading system
+    # Start trading system; ConfigManager reports a missing/invalid
+    # config.json itself, so no pre-flight existence check (TOCTOU-free)
     system = TradingSystem('config.json')
     system.start()
 